@@ -1,12 +1,86 @@
-from flask import Flask, request, abort, jsonify
+from flask import Flask, request, abort, jsonify, g
 from flask_cors import CORS
+from sqlalchemy.orm import configure_mappers
 import random
+import resource
+import time
 
-from models import setup_db, Question, Category
+from models import db, setup_db, Question, Category
 
 QUESTIONS_PER_PAGE = 10
 
 
+def max_rss_kb():
+    # peak resident set size of the current process (kilobytes on Linux)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def load_categories():
+    categories = Category.query.order_by(Category.id).all()
+
+    categories_dict = {}
+    for category in categories:
+        categories_dict[category.id] = category.type
+
+    return categories_dict
+
+
+def get_categories(app):
+    categories_dict = app.config.get('CATEGORIES')
+    if categories_dict is None:
+        categories_dict = load_categories()
+    return categories_dict
+
+
+"""
+mark_started(app)
+    records when the current process started serving the app, the origin
+    of the first request report. Called again by each gunicorn worker
+    after the fork.
+"""
+
+
+def mark_started(app):
+    app.config['STARTED_AT'] = time.perf_counter()
+
+
+"""
+preload(app)
+    configures the mappers and loads the categories once, before the
+    workers are forked, so that they share them copy-on-write.
+    The session is removed and the engine disposed at the end, closing
+    the connection used by the preload, so that no connection is
+    inherited by the workers.
+"""
+
+
+def preload(app):
+    started = time.perf_counter()
+
+    with app.app_context():
+        configure_mappers()
+        mappers_done = time.perf_counter()
+
+        # categories can not be changed through the API, so they are safe
+        # to be shared between the workers
+        app.config['CATEGORIES'] = load_categories()
+        categories_done = time.perf_counter()
+
+        # give the connection back to the pool before closing it
+        db.session.remove()
+        db.get_engine(app).dispose()
+
+    app.logger.info(
+        'preload: mappers %.1f ms, %d categories %.1f ms, '
+        'total %.1f ms, max rss %d kB',
+        (mappers_done - started) * 1000,
+        len(app.config['CATEGORIES']),
+        (categories_done - mappers_done) * 1000,
+        (time.perf_counter() - started) * 1000,
+        max_rss_kb()
+    )
+
+
 def create_app(test_config=None):
     # create and configure the app
     app = Flask(__name__)
@@ -18,6 +92,30 @@ def create_app(test_config=None):
 
     setup_db(app)
 
+    if app.config.get('PRELOAD_CACHE', False):
+        preload(app)
+
+    mark_started(app)
+
+    @app.before_first_request
+    def start_first_request():
+        g.first_request_started = time.perf_counter()
+
+    @app.teardown_request
+    def report_first_request(error):
+        first_request_started = g.pop('first_request_started', None)
+        if first_request_started is None:
+            return
+
+        finished = time.perf_counter()
+        app.logger.info(
+            'first request %.1f ms, first response %.1f ms after start, '
+            'max rss %d kB',
+            (finished - first_request_started) * 1000,
+            (finished - app.config['STARTED_AT']) * 1000,
+            max_rss_kb()
+        )
+
     """
     @TODO: Set up CORS. Allow '*' for origins.
             Delete the sample route after completing the TODOs
@@ -42,11 +140,7 @@ def create_app(test_config=None):
     """
     @app.route('/categories', methods=['GET'])
     def categories():
-        categories = Category.query.all()
-
-        categories_dict = {}
-        for category in categories:
-            categories_dict[category.id] = category.type
+        categories_dict = get_categories(app)
 
         return jsonify({
             "success": True,
@@ -78,11 +172,7 @@ def create_app(test_config=None):
         if len(questions_lst) == 0:
             abort(404)
 
-        categories = Category.query.all()
-
-        categories_dict = {}
-        for category in categories:
-            categories_dict[category.id] = category.type
+        categories_dict = get_categories(app)
 
         return jsonify({
             "questions": questions_lst,
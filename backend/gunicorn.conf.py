@@ -0,0 +1,28 @@
+import gc
+import logging
+
+from flaskr import mark_started
+from models import db
+
+# show the startup timing report of the app (Flask 1.0 logs to 'flask.app')
+logging.getLogger('flask.app').setLevel(logging.INFO)
+
+# create the app once in the master, workers share it copy-on-write
+preload_app = True
+raw_env = ['PRELOAD_CACHE=1']
+workers = 4
+bind = '0.0.0.0:5000'
+
+
+def pre_fork(server, worker):
+    # keep the garbage collector from touching (and so copying) the
+    # objects loaded by the master
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # never reuse a database connection created before the fork
+    app = server.app.wsgi()
+    db.get_engine(app).dispose()
+    mark_started(app)
+    app.logger.info('worker %s started', worker.pid)
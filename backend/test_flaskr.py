@@ -2,7 +2,7 @@ import unittest
 import json
 import random
 
-from flaskr import create_app
+from flaskr import create_app, preload
 from models import db, Category, Question
 
 QUESTIONS_PER_PAGE = 10
@@ -78,6 +78,81 @@ class TriviaTestCase(unittest.TestCase):
             list(categories_dict.values())
         )
 
+    def create_preloaded_app(self):
+        test_config = {
+            'SQLALCHEMY_DATABASE_URI': self.database_path,
+            'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+            'PRELOAD_CACHE': True
+        }
+        return create_app(test_config)
+
+    def add_category(self, app, category_type):
+        with app.app_context():
+            categories_dict = {}
+            for category in Category.query.all():
+                categories_dict[category.id] = category.type
+
+            self.db.session.add(Category(category_type))
+            self.db.session.commit()
+
+        self.addCleanup(self.delete_category, app, category_type)
+        return categories_dict
+
+    def delete_category(self, app, category_type):
+        with app.app_context():
+            Category.query.filter(Category.type == category_type).delete()
+            self.db.session.commit()
+
+    def test_preload_categories(self):
+        app = self.create_preloaded_app()
+        categories_dict = self.add_category(app, "Preload test")
+
+        self.assertDictEqual(app.config['CATEGORIES'], categories_dict)
+
+    def test_preload_closes_connection(self):
+        test_config = {
+            'SQLALCHEMY_DATABASE_URI': self.database_path,
+            'SQLALCHEMY_TRACK_MODIFICATIONS': False
+        }
+        app = create_app(test_config)
+        pool = self.db.get_engine(app).pool
+
+        preload(app)
+
+        # the connection used by the preload is neither left checked out
+        # nor kept open in the pool, so it can not be inherited by a fork
+        self.assertEqual(pool.checkedout(), 0)
+        self.assertEqual(pool.checkedin(), 0)
+
+    def test_get_preloaded_categories(self):
+        app = self.create_preloaded_app()
+        # added after the preload, it must not be served
+        categories_dict = self.add_category(app, "Preload test")
+
+        res = app.test_client().get('/categories')
+        data = json.loads(res.data)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(data['success'])
+        self.assertListEqual(
+            list(data['categories'].values()),
+            list(categories_dict.values())
+        )
+
+    def test_get_paginated_questions_preloaded_categories(self):
+        app = self.create_preloaded_app()
+        # added after the preload, it must not be served
+        categories_dict = self.add_category(app, "Preload test")
+
+        res = app.test_client().get('/questions?page=1')
+        data = json.loads(res.data)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertListEqual(
+            list(data['categories'].values()),
+            list(categories_dict.values())
+        )
+
     def test_get_paginated_questions(self):
         page = 1
         res = self.client().get(f'/questions?page={page}')